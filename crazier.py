@@ -1,22 +1,216 @@
+import argparse
+import asyncio
+from array import array
 import json
-import requests
+from dataclasses import asdict, dataclass
+import httpx
 import time
 import zipfile
 import io
+import logging
+import logging.handlers
+import os
+import queue
+import random
 import xml.etree.ElementTree as ET
-from typing import List, Dict, Optional
+from pathlib import Path
+from typing import Iterable, List, Dict, Optional, Tuple
 import re
+import sqlite3
+import sys
+import tempfile
+
+try:
+    from rapidfuzz import fuzz, process, utils
+except ImportError:  # Fuzzy name matching is optional
+    fuzz = process = utils = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads  # Parses bytes directly, no intermediate str
+except ImportError:  # Fall back to the stdlib parser, which also accepts bytes
+    _json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+class AsyncRateLimiter:
+    """
+    Token bucket allowing at most `rate` requests per `period` seconds.
+    Callers only wait when the actual request rate would exceed the limit.
+    `burst` caps how many requests may go out back to back; any window of
+    `period` seconds sees at most `rate + burst - 1` requests.
+    """
+    def __init__(self, rate: float, period: float = 1.0, burst: int = 1):
+        self.rate = rate
+        self.period = period
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                elapsed = now - self._last_refill
+                self._tokens = min(self.burst, self._tokens + elapsed * self.rate / self.period)
+                self._last_refill = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                await asyncio.sleep((1 - self._tokens) * self.period / self.rate)
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+class SubmissionsCache:
+    """
+    SQLite-backed cache of raw submissions JSON keyed by zero-padded CIK.
+    Entries older than `ttl` seconds are treated as missing.
+    """
+    def __init__(self, path: Path, ttl: float = 86400):
+        self.ttl = ttl
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = self._connect(str(path))
+        except (OSError, sqlite3.Error) as e:
+            # Also covers a corrupt or non-SQLite file, which only fails on first use
+            logger.warning("Could not open submissions cache at %s, using memory: %s", path, e)
+            self._conn = self._connect(":memory:")
+
+    @staticmethod
+    def _connect(database: str) -> sqlite3.Connection:
+        # Bulk loads write from a worker thread while the event loop waits on them
+        conn = sqlite3.connect(database, check_same_thread=False)
+        try:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS submissions "
+                "(cik TEXT PRIMARY KEY, fetched_at REAL NOT NULL, body BLOB NOT NULL)"
+            )
+            conn.commit()
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    def get(self, cik: str) -> Optional[bytes]:
+        """Cached body for the CIK, or None if missing, stale or unreadable."""
+        try:
+            row = self._conn.execute(
+                "SELECT fetched_at, body FROM submissions WHERE cik = ?", (cik,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("Could not read submissions cache for CIK %s: %s", cik, e)
+            return None
+        if row is None or time.time() - row[0] > self.ttl:
+            return None
+        return row[1]
+
+    def set(self, cik: str, body: bytes) -> None:
+        """Store the body for the CIK; failures are logged and the write skipped."""
+        try:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO submissions (cik, fetched_at, body) VALUES (?, ?, ?)",
+                    (cik, time.time(), body)
+                )
+        except sqlite3.Error as e:
+            logger.warning("Could not cache submissions for CIK %s: %s", cik, e)
+
+    def set_many(self, items: Iterable[Tuple[str, bytes]]) -> int:
+        """Store many (cik, body) pairs in one transaction, returning the count."""
+        fetched_at = time.time()
+        with self._conn:
+            cursor = self._conn.executemany(
+                "INSERT OR REPLACE INTO submissions (cik, fetched_at, body) VALUES (?, ?, ?)",
+                ((cik, fetched_at, body) for cik, body in items)
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+@dataclass(slots=True)
+class IndustryInfo:
+    """Industry details extracted from one company's submissions data."""
+    sic_code: Optional[str] = None
+    sic_description: Optional[str] = None
+    business_description: Optional[str] = None
+    industry_category: Optional[str] = None
+    company_type: Optional[str] = None
+    form_d_info: Optional[Dict] = None
+    source: str = 'submissions'
+    confidence: Optional[str] = None  # Only set by name-based classification
+
+
+@dataclass(slots=True)
+class CompanyRecord:
+    """One company in the results of a comprehensive search."""
+    cik: str
+    name: str
+    ticker: str
+    company_type: str
+    sic_code: Optional[str]
+    sic_description: Optional[str]
+    business_description: Optional[str]
+    industry_category: Optional[str]
+    form_d_info: Optional[Dict]
+    data_source: str
+    filing_count: int
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
 
 class CompleteSECCompanySearch:
-    def __init__(self, user_agent: str = "MyCompany support@mycompany.com"):
+    def __init__(self, user_agent: str = "MyCompany support@mycompany.com", refresh: bool = False):
         """
         Complete SEC company search including both public and private companies.
+        Pass refresh=True to ignore cached submissions and refetch them once.
         """
         self.headers = {
             'User-Agent': user_agent
         }
-        self.base_delay = 0.1
-        self.bulk_submissions_cache = None  # Cache for bulk submissions data
+        # Retry rate-limit (SEC answers 403 or 429) and transient server errors
+        self.max_retries = 4
+        self.retry_initial_delay = 0.2
+        self.retry_max_delay = 10.0
+        self.retry_statuses = {403, 429, 500, 502, 503, 504}
+        self._rate_limiter = AsyncRateLimiter(9, 1.0)  # Stay under SEC's 10 requests/second limit
+        # On-disk copy of company_tickers.json, revalidated with its ETag
+        self._tickers_cache_path = Path("~/.cache/sec/tickers.json").expanduser()
+        self._tickers_etag_path = Path("~/.cache/sec/tickers.etag").expanduser()
+        self._exact_title_index = None  # Case-folded title -> row ids in _ticker_rows
+        self._ticker_index = {}  # Case-folded ticker symbol -> row id
+        self._ticker_rows = []  # Ticker records in file order
+        self._titles_processed = []  # Titles normalized for rapidfuzz, parallel to _ticker_rows
+        self._titles_lower = []  # Case-folded titles parallel to _ticker_rows
+        self._tickers_lower = []  # Case-folded tickers parallel to _ticker_rows
+        self.min_exact_matches = 3  # Fewer substring hits than this triggers fuzzy matching
+        self._title_index = {}  # Trigram of title or ticker -> row ids containing it
+        
+        # Submissions JSON cached for a day, shared by CIK lookups and enrichment
+        self.refresh = refresh
+        self._refreshed_ciks = set()
+        self._submissions_cache = SubmissionsCache(Path("~/.cache/sec/submissions.sqlite").expanduser())
+        self.bulk_submissions_url = "https://www.sec.gov/Archives/edgar/daily-index/bulkdata/submissions.zip"
+        
+        # One pooled client for every request, so connections and TLS sessions are reused
+        self._client = httpx.AsyncClient(
+            headers=self.headers,
+            http2=True,
+            timeout=12,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10)
+        )
         
         # Enhanced SIC code mapping
         self.sic_mapping = {
@@ -41,6 +235,14 @@ class CompleteSECCompanySearch:
             "7371": "Computer Programming Services",
             "7389": "Business Services, NEC"
         }
+        
+        # SIC descriptions keyed by both str and int codes, so lookups never
+        # re-stringify; descriptions are interned so repeated results share them
+        self._sic_lookup = {}
+        for code, description in self.sic_mapping.items():
+            description = sys.intern(description)
+            self._sic_lookup[code] = description
+            self._sic_lookup[int(code)] = description
 
         # Form D industry mapping (from SEC Form D categories)
         self.form_d_industries = {
@@ -54,81 +256,409 @@ class CompleteSECCompanySearch:
             "Retailing": "Retail",
             "Restaurants": "Food & Restaurants",
             "Technology": "Technology",
-            "Travel": "Travel & Tourism"
+            "Travel": "Travel & Tourism",
+            # industryGroupType values as they appear in Form D XML
+            "Commercial Banking": "Financial Services",
+            "Insurance": "Financial Services",
+            "Investing": "Financial Services",
+            "Investment Banking": "Financial Services",
+            "Pooled Investment Fund": "Financial Services",
+            "Other Banking and Financial Services": "Financial Services",
+            "Coal Mining": "Energy",
+            "Electric Utilities": "Energy",
+            "Energy Conservation": "Energy",
+            "Environmental Services": "Energy",
+            "Oil and Gas": "Energy",
+            "Other Energy": "Energy",
+            "Biotechnology": "Healthcare",
+            "Health Insurance": "Healthcare",
+            "Hospitals and Physicians": "Healthcare",
+            "Pharmaceuticals": "Healthcare",
+            "Other Health Care": "Healthcare",
+            "Commercial": "Real Estate",
+            "Construction": "Real Estate",
+            "REITS and Finance": "Real Estate",
+            "Residential": "Real Estate",
+            "Other Real Estate": "Real Estate",
+            "Computers": "Technology",
+            "Telecommunications": "Technology",
+            "Other Technology": "Technology",
+            "Airlines and Airports": "Travel & Tourism",
+            "Lodging and Conventions": "Travel & Tourism",
+            "Tourism and Travel Services": "Travel & Tourism",
+            "Other Travel": "Travel & Tourism"
         }
+        
+        # Enhanced keyword matching for name-based classification, in priority order
+        self.industry_keywords = {
+            'Technology': ['software', 'tech', 'systems', 'data', 'cloud', 'cyber', 'digital', 
+                          'computer', 'platform', 'analytics', 'ai', 'artificial intelligence',
+                          'app', 'mobile', 'web', 'internet', 'online'],
+            'Financial Services': ['bank', 'financial', 'capital', 'investment', 'fund', 'credit', 
+                                 'loan', 'mortgage', 'insurance', 'securities', 'finance'],
+            'Healthcare': ['pharma', 'medical', 'health', 'bio', 'therapeutic', 'clinical',
+                          'hospital', 'drug', 'medicine', 'healthcare'],
+            'Retail': ['retail', 'store', 'shop', 'market', 'grocery', 'consumer', 'commerce'],
+            'Energy': ['energy', 'oil', 'gas', 'petroleum', 'solar', 'wind', 'utility',
+                      'electric', 'power', 'renewable'],
+            'Manufacturing': ['manufacturing', 'industrial', 'auto', 'motor', 'machinery',
+                            'equipment', 'materials', 'production'],
+            'Food & Beverage': ['food', 'restaurant', 'coffee', 'beverage', 'dining', 'kitchen',
+                              'cafe', 'bar', 'brewery', 'wine'],
+            'Real Estate': ['real estate', 'property', 'construction', 'building', 'development'],
+            'Transportation': ['transport', 'logistics', 'shipping', 'delivery', 'freight'],
+            'Media': ['media', 'entertainment', 'publishing', 'content', 'broadcast', 'film']
+        }
+        
+        # One alternation over every keyword, scanned once per name. Keywords are
+        # listed in industry priority order so that, at any position, the
+        # highest-priority keyword starting there is the one reported.
+        self._keyword_rank = {}
+        for rank, keywords in enumerate(self.industry_keywords.values()):
+            for keyword in keywords:
+                self._keyword_rank.setdefault(keyword, rank)
+        self._industry_keyword_re = re.compile(
+            '(?=(' + '|'.join(re.escape(keyword) for keyword in self._keyword_rank) + '))'
+        )
+        
+        # Industry ids used by bulk classification; 0 means no keyword matched
+        self.industry_categories = ('Unknown', *self.industry_keywords)
+        
+        # Form D offering amount pattern, compiled once and run over the raw response bytes
+        self._form_d_amount_re = re.compile(rb'Total Offering Amount.*?\$([0-9,]+)')
     
-    def _make_request(self, url: str) -> Optional[Dict]:
-        """Make a request with proper rate limiting and error handling."""
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and the submissions cache."""
+        await self._client.aclose()
+        self._submissions_cache.close()
+
+    async def __aenter__(self) -> "CompleteSECCompanySearch":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    @staticmethod
+    def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+        """Read the Retry-After header in seconds, if the server sent one."""
         try:
-            time.sleep(self.base_delay)
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Request error for {url}: {e}")
+            return max(float(response.headers['Retry-After']), 0.0)
+        except (KeyError, ValueError):
             return None
 
-    def _fetch_bulk_submissions_sample(self) -> Optional[Dict]:
+    def _backoff_seconds(self, attempt: int) -> float:
+        """Exponential backoff with jitter for the given zero-based attempt."""
+        delay = self.retry_initial_delay * 2 ** attempt + random.uniform(0, self.retry_initial_delay)
+        return min(delay, self.retry_max_delay)
+
+    async def _get(self, url: str, headers: Optional[Dict] = None) -> httpx.Response:
+        """
+        Rate-limited GET that retries rate-limit responses, 5xx errors and
+        transport failures with exponential backoff, honouring Retry-After.
+        """
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            try:
+                async with self._rate_limiter:
+                    response = await self._client.get(url, headers=headers)
+            except httpx.TransportError as e:
+                if last_attempt:
+                    raise
+                logger.info("Retrying %s after %s", url, e)
+                await asyncio.sleep(self._backoff_seconds(attempt))
+                continue
+            
+            if response.status_code not in self.retry_statuses or last_attempt:
+                return response
+            
+            delay = self._retry_after_seconds(response)
+            if delay is None:
+                delay = self._backoff_seconds(attempt)
+            elif delay > self.retry_max_delay:
+                # Don't stall every pending request on a long server-requested wait
+                logger.warning("Giving up on %s: server asked to retry after %.0fs", url, delay)
+                return response
+            logger.info("Retrying %s in %.1fs after HTTP %s", url, delay, response.status_code)
+            await asyncio.sleep(delay)
+        
+        return response
+
+    async def _get_submissions(self, cik_formatted: str) -> Optional[Dict]:
         """
-        Fetch a sample of the bulk submissions data for searching private companies.
-        Note: Full bulk data is 100MB+, so we'll use individual API calls instead.
+        Get the submissions JSON for a CIK, served from the on-disk cache when
+        a fresh copy exists.
         """
+        body = None
+        if not self.refresh or cik_formatted in self._refreshed_ciks:
+            body = self._submissions_cache.get(cik_formatted)
+        
+        cached = body is not None
+        if not cached:
+            url = f"https://data.sec.gov/submissions/CIK{cik_formatted}.json"
+            try:
+                response = await self._get(url)
+                response.raise_for_status()
+                body = response.content
+            except httpx.HTTPError as e:
+                logger.warning("Request error for %s: %s", url, e)
+                return None
+        
         try:
-            print("Fetching bulk submissions data sample...")
-            # For demo purposes, we'll just return None and use individual API calls
-            # In production, you might want to download and cache the full bulk data
+            submissions_data = _json_loads(body)
+        except ValueError as e:
+            logger.warning("Invalid submissions data for CIK %s: %s", cik_formatted, e)
             return None
-        except Exception as e:
-            print(f"Error fetching bulk data: {e}")
+        
+        if not cached:
+            self._submissions_cache.set(cik_formatted, body)
+            self._refreshed_ciks.add(cik_formatted)
+        
+        return submissions_data
+
+    async def load_bulk_submissions(self) -> int:
+        """
+        Download SEC's bulk submissions.zip and load every CIK*.json into the
+        submissions cache, so later lookups never hit the per-CIK API.
+        The archive is large, so it is streamed to a temporary file rather
+        than held in memory. Returns the number of companies cached.
+        """
+        logger.info("Fetching bulk submissions data...")
+        with tempfile.TemporaryFile() as archive:
+            try:
+                async with self._rate_limiter:
+                    async with self._client.stream('GET', self.bulk_submissions_url, timeout=None) as response:
+                        response.raise_for_status()
+                        async for chunk in response.aiter_bytes(1 << 20):
+                            archive.write(chunk)
+            except httpx.HTTPError as e:
+                logger.warning("Error fetching bulk data: %s", e)
+                return 0
+            
+            archive.seek(0)
+            try:
+                # Unzipping and inserting take a while, keep them off the event loop
+                ciks = await asyncio.to_thread(self._store_bulk_archive, archive)
+            except (zipfile.BadZipFile, sqlite3.Error) as e:
+                logger.warning("Error reading bulk data: %s", e)
+                return 0
+        
+        # These rows are as fresh as a refetch, so --refresh must not skip them
+        self._refreshed_ciks.update(ciks)
+        logger.info("Cached submissions for %s companies", len(ciks))
+        return len(ciks)
+
+    def _store_bulk_archive(self, archive) -> List[str]:
+        """Write every CIK*.json in the bulk archive to the cache, returning the CIKs."""
+        with zipfile.ZipFile(archive) as zf:
+            # Skip the paginated CIK*-submissions-NNN.json overflow files
+            ciks = [name[3:-5] for name in zf.namelist() if re.fullmatch(r'CIK\d{10}\.json', name)]
+            self._submissions_cache.set_many((cik, zf.read(f"CIK{cik}.json")) for cik in ciks)
+        return ciks
+
+    def _read_cached_tickers(self) -> Optional[bytes]:
+        """Read the cached company_tickers.json body, if any."""
+        try:
+            return self._tickers_cache_path.read_bytes()
+        except OSError:
             return None
 
-    def search_public_companies(self, company_name: str) -> List[Dict]:
-        """Search public companies using the tickers API."""
+    def _read_cached_tickers_etag(self) -> Optional[str]:
+        """Read the ETag stored alongside the cached company_tickers.json, if any."""
+        try:
+            return self._tickers_etag_path.read_text().strip() or None
+        except OSError:
+            return None
+
+    def _write_cached_tickers(self, body: bytes, etag: Optional[str]) -> None:
+        """Store the company_tickers.json body and its ETag on disk."""
+        try:
+            self._tickers_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._tickers_cache_path.with_suffix('.tmp')
+            tmp_path.write_bytes(body)
+            os.replace(tmp_path, self._tickers_cache_path)
+            if etag:
+                self._tickers_etag_path.write_text(etag)
+            elif self._tickers_etag_path.exists():
+                self._tickers_etag_path.unlink()
+        except OSError as e:
+            logger.warning("Could not cache company tickers: %s", e)
+
+    @staticmethod
+    def _trigrams(text: str) -> set:
+        """All three-character substrings of text."""
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    def _build_tickers_index(self, companies_data: Dict) -> None:
+        """
+        Index ticker records by exact ticker, exact case-folded title and
+        trigram. Titles and tickers are case-folded once here into lists
+        parallel to _ticker_rows, so searches never re-fold them.
+        """
+        rows = list(companies_data.values())
+        titles_lower = [company['title'].casefold() for company in rows]
+        tickers_lower = [company.get('ticker', '').casefold() for company in rows]
+        exact_title_index = {}
+        ticker_index = {}
+        title_index = {}
+        
+        for row_id, (title_lower, ticker_lower) in enumerate(zip(titles_lower, tickers_lower)):
+            exact_title_index.setdefault(title_lower, []).append(row_id)
+            if ticker_lower:
+                ticker_index.setdefault(ticker_lower, row_id)
+            for gram in self._trigrams(title_lower) | self._trigrams(ticker_lower):
+                title_index.setdefault(gram, set()).add(row_id)
+        
+        self._ticker_rows = rows
+        if utils is not None:
+            self._titles_processed = [utils.default_process(company['title']) for company in rows]
+        self._titles_lower = titles_lower
+        self._tickers_lower = tickers_lower
+        self._title_index = title_index
+        self._ticker_index = ticker_index
+        self._exact_title_index = exact_title_index
+
+    async def _load_tickers_index(self) -> Optional[Dict[str, List[int]]]:
+        """
+        Load company_tickers.json and index it by case-folded title.
+        The file is cached on disk and revalidated with If-None-Match, so
+        SEC only sends the body again when it has changed.
+        """
+        if self._exact_title_index is not None:
+            return self._exact_title_index
+        
         url = "https://www.sec.gov/files/company_tickers.json"
-        companies_data = self._make_request(url)
+        cached_body = self._read_cached_tickers()
+        headers = {}
+        etag = self._read_cached_tickers_etag() if cached_body is not None else None
+        if etag:
+            headers['If-None-Match'] = etag
+        
+        body = None
+        try:
+            response = await self._get(url, headers=headers)
+            if response.status_code == 304:
+                body = cached_body
+            else:
+                response.raise_for_status()
+                body = response.content
+                self._write_cached_tickers(body, response.headers.get('ETag'))
+        except httpx.HTTPError as e:
+            logger.warning("Request error for %s: %s", url, e)
+            body = cached_body  # Fall back to a stale copy if we have one
+        
+        if not body:
+            return None
+        
+        try:
+            companies_data = _json_loads(body)
+        except ValueError as e:
+            logger.warning("Invalid company tickers data: %s", e)
+            return None
+        
+        self._build_tickers_index(companies_data)
+        return self._exact_title_index
+
+    def _matching_rows(self, query_lower: str) -> List[int]:
+        """
+        Row ids whose title or ticker contains the query, or whose title is
+        contained in the query. Candidates come from intersecting trigram
+        postings, so only a handful of rows are checked per query.
+        """
+        titles_lower = self._titles_lower
+        tickers_lower = self._tickers_lower
+        
+        if len(query_lower) < 3:
+            # Too short for trigrams, fall back to a full scan
+            return [
+                row_id for row_id, title_lower in enumerate(titles_lower)
+                if (query_lower in title_lower or
+                    query_lower in tickers_lower[row_id] or
+                    title_lower in query_lower)
+            ]
         
-        if not companies_data:
+        matched = set()
+        postings = sorted(
+            (self._title_index.get(gram, set()) for gram in self._trigrams(query_lower)),
+            key=len
+        )
+        for row_id in postings[0].intersection(*postings[1:]):
+            if query_lower in titles_lower[row_id] or query_lower in tickers_lower[row_id]:
+                matched.add(row_id)
+        
+        # Titles contained in the query must equal one of its substrings
+        for start in range(len(query_lower)):
+            for end in range(start + 1, len(query_lower) + 1):
+                matched.update(self._exact_title_index.get(query_lower[start:end], ()))
+        
+        return sorted(matched)
+
+    def _fuzzy_matching_rows(self, company_name: str, limit: int = 10) -> List[int]:
+        """
+        Row ids of titles that approximately match the name ("Pepsi" vs
+        "PepsiCo Inc"), best first. Empty when rapidfuzz isn't installed.
+        """
+        if process is None:
+            return []
+        
+        results = process.extract(
+            utils.default_process(company_name), self._titles_processed,
+            scorer=fuzz.token_set_ratio, processor=None,
+            limit=limit, score_cutoff=85
+        )
+        return [row_id for _, _, row_id in results]
+
+    async def search_public_companies(self, company_name: str) -> List[Dict]:
+        """Search public companies using the tickers API."""
+        tickers_index = await self._load_tickers_index()
+        
+        if not tickers_index:
             return []
         
         matches = []
-        company_name_lower = company_name.lower()
+        company_name_lower = company_name.casefold()
         
-        for key, company in companies_data.items():
-            title_lower = company['title'].lower()
-            ticker_lower = company.get('ticker', '').lower()
-            
-            if (company_name_lower in title_lower or 
-                company_name_lower in ticker_lower or
-                title_lower in company_name_lower):
-                
-                matches.append({
-                    'cik': str(company['cik_str']).zfill(10),
-                    'name': company['title'],
-                    'ticker': company['ticker'],
-                    'company_type': 'public'
-                })
+        # A ticker symbol query ("TSLA") resolves directly without a substring search
+        ticker_row = self._ticker_index.get(company_name_lower)
+        if ticker_row is not None:
+            row_ids = [ticker_row]
+        else:
+            row_ids = self._matching_rows(company_name_lower)
+            if len(row_ids) < self.min_exact_matches:
+                row_ids += [row_id for row_id in self._fuzzy_matching_rows(company_name) if row_id not in row_ids]
+        
+        for row_id in row_ids:
+            company = self._ticker_rows[row_id]
+            matches.append({
+                'cik': str(company['cik_str']).zfill(10),
+                'name': company['title'],
+                'ticker': company['ticker'],
+                'company_type': 'public'
+            })
         
         return matches
 
-    def search_by_cik_direct(self, cik: str) -> Optional[Dict]:
+    async def search_by_cik_direct(self, cik: str) -> Optional[Dict]:
         """
         Search for a company by CIK directly using submissions API.
         This works for both public and private companies.
         """
         cik_formatted = str(cik).zfill(10)
-        url = f"https://data.sec.gov/submissions/CIK{cik_formatted}.json"
         
-        submissions_data = self._make_request(url)
+        submissions_data = await self._get_submissions(cik_formatted)
         if submissions_data:
-            return {
-                'cik': cik_formatted,
-                'name': submissions_data.get('name', 'Unknown'),
-                'ticker': submissions_data.get('tickers', [''])[0] if submissions_data.get('tickers') else '',
-                'company_type': 'public' if submissions_data.get('tickers') else 'private',
-                'submissions_data': submissions_data
-            }
+            return self._match_from_submissions(cik_formatted, submissions_data)
         return None
 
+    @staticmethod
+    def _match_from_submissions(cik_formatted: str, submissions_data: Dict) -> Dict:
+        """Build a search match from submissions data, keeping only the fields results need."""
+        return {
+            'cik': cik_formatted,
+            'name': submissions_data.get('name', 'Unknown'),
+            'ticker': submissions_data.get('tickers', [''])[0] if submissions_data.get('tickers') else '',
+            'company_type': 'public' if submissions_data.get('tickers') else 'private'
+        }
+
     def search_edgar_full_text(self, company_name: str, max_results: int = 10) -> List[Dict]:
         """
         Alternative search method using EDGAR's search capabilities.
@@ -141,7 +671,7 @@ class CompleteSECCompanySearch:
         # 2. Use the bulk submissions.zip file
         # 3. Use a third-party SEC API service
         
-        print(f"  Searching EDGAR full-text for '{company_name}'...")
+        logger.info("Searching EDGAR full-text for '%s'...", company_name)
         found_companies = []
         
         # For demonstration, let's try some common CIK patterns
@@ -153,7 +683,69 @@ class CompleteSECCompanySearch:
         
         return found_companies
 
-    def parse_form_d_filing(self, cik: str, accession_number: str) -> Dict:
+    def _parse_form_d_xml(self, content: bytes) -> Optional[Dict]:
+        """
+        Extract industry, revenue range and offering amount from Form D XML in
+        one streaming pass. Works on the raw primary_doc.xml and on the XML
+        embedded in the full .txt submission. Returns None if there is no
+        parseable Form D XML.
+        """
+        start = content.find(b'<edgarSubmission')
+        end = content.rfind(b'</edgarSubmission>')
+        if start == -1 or end == -1:
+            return None
+        
+        wanted = {'industryGroupType', 'revenueRange', 'totalOfferingAmount'}
+        fields = {}
+        try:
+            xml_body = io.BytesIO(content[start:end + len('</edgarSubmission>')])
+            for _, elem in ET.iterparse(xml_body):
+                tag = elem.tag.rsplit('}', 1)[-1]  # Drop any namespace
+                if tag in wanted and tag not in fields and elem.text and elem.text.strip():
+                    fields[tag] = elem.text.strip()
+                    if len(fields) == len(wanted):
+                        break
+                elem.clear()
+        except ET.ParseError:
+            return None
+        
+        if not fields:
+            return None
+        
+        industry_group = fields.get('industryGroupType')
+        return {
+            'industry_category': self.form_d_industries.get(industry_group, industry_group),
+            'revenue_range': fields.get('revenueRange'),
+            'offering_amount': fields.get('totalOfferingAmount')
+        }
+
+    def _scan_form_d_text(self, content: bytes) -> Dict:
+        """Fallback for rendered Form D pages: probe the raw bytes for keywords."""
+        fields = {}
+        
+        # Look for industry group information
+        if b'Technology' in content:
+            fields['industry_category'] = 'Technology'
+        elif b'Financial' in content or b'Banking' in content:
+            fields['industry_category'] = 'Financial Services'
+        elif b'Health' in content or b'Medical' in content:
+            fields['industry_category'] = 'Healthcare'
+        
+        # Extract offering amount if available
+        amount_match = self._form_d_amount_re.search(content)
+        if amount_match:
+            fields['offering_amount'] = amount_match.group(1).decode('ascii')
+        
+        return fields
+
+    def _parse_form_d_content(self, content: bytes) -> Dict:
+        """Parse a Form D response body, preferring the structured XML."""
+        fields = self._parse_form_d_xml(content)
+        if fields is None:
+            fields = self._scan_form_d_text(content)
+        return fields
+
+    async def parse_form_d_filing(self, cik: str, accession_number: str) -> Dict:
         """
         Parse a Form D filing to extract industry information.
         """
@@ -169,244 +761,307 @@ class CompleteSECCompanySearch:
             cik_no_zeros = str(int(cik))  # Remove leading zeros for URL
             acc_clean = accession_number.replace('-', '')
             
-            # Try multiple possible URLs for Form D
+            # Try multiple possible URLs for Form D, raw XML first so it can be parsed structurally
             possible_urls = [
-                f"https://www.sec.gov/Archives/edgar/data/{cik_no_zeros}/{accession_number}/xslFormDX01/primary_doc.xml",
-                f"https://www.sec.gov/Archives/edgar/data/{cik_no_zeros}/{accession_number}/primary_doc.xml",
+                f"https://www.sec.gov/Archives/edgar/data/{cik_no_zeros}/{acc_clean}/primary_doc.xml",
+                f"https://www.sec.gov/Archives/edgar/data/{cik_no_zeros}/{acc_clean}/xslFormDX01/primary_doc.xml",
                 f"https://www.sec.gov/Archives/edgar/data/{cik_no_zeros}/{accession_number}.txt"
             ]
             
-            for url in possible_urls:
-                try:
-                    response = requests.get(url, headers=self.headers)
-                    if response.status_code == 200:
-                        if url.endswith('.xml'):
-                            # Parse XML Form D
-                            content = response.text
-                            # Look for industry group information
-                            if 'Technology' in content:
-                                industry_info['industry_category'] = 'Technology'
-                            elif 'Financial' in content or 'Banking' in content:
-                                industry_info['industry_category'] = 'Financial Services'
-                            elif 'Health' in content or 'Medical' in content:
-                                industry_info['industry_category'] = 'Healthcare'
-                            # Add more pattern matching as needed
-                            
-                            # Extract offering amount if available
-                            amount_match = re.search(r'Total Offering Amount.*?\$([0-9,]+)', content)
-                            if amount_match:
-                                industry_info['offering_amount'] = amount_match.group(1)
-                                
-                        break
-                        
-                except Exception as e:
-                    continue
+            # Request all candidates at once. A 200 is only used once every more
+            # preferred URL has finished without one; the rest are then cancelled.
+            tasks = [asyncio.create_task(self._get(url)) for url in possible_urls]
+            try:
+                pending = set(tasks)
+                best_response = None
+                while pending and best_response is None:
+                    _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in tasks:  # In preference order
+                        if not task.done():
+                            break
+                        if task.exception() is None and task.result().status_code == 200:
+                            best_response = task.result()
+                            break
+                
+                if best_response is not None:
+                    industry_info.update(self._parse_form_d_content(best_response.content))
+            finally:
+                for task in tasks:
+                    task.cancel()
                     
         except Exception as e:
-            print(f"Error parsing Form D for CIK {cik}: {e}")
+            logger.warning("Error parsing Form D for CIK %s: %s", cik, e)
         
         return industry_info
 
-    def get_enhanced_submissions_data(self, cik: str) -> Optional[Dict]:
+    @staticmethod
+    def _summarize_recent(recent_filings: Dict) -> Dict:
+        """
+        Summarize the column-oriented recent filings table in one pass: the
+        filing count plus the accession number and date of the latest Form D.
+        """
+        forms = recent_filings.get('form', [])
+        summary = {
+            'form_count': len(forms),
+            'form_d_accession': None,
+            'form_d_filing_date': None
+        }
+        
+        filing_dates = recent_filings.get('filingDate', [])
+        for i, (form_type, accession_number) in enumerate(zip(forms, recent_filings.get('accessionNumber', []))):
+            if form_type == 'D' and accession_number:  # Form D filing
+                summary['form_d_accession'] = accession_number
+                summary['form_d_filing_date'] = filing_dates[i] if i < len(filing_dates) else None
+                break
+        
+        return summary
+
+    async def get_enhanced_submissions_data(self, cik: str) -> Optional[Dict]:
         """Get enhanced submissions data with Form D parsing for private companies."""
         cik_formatted = str(cik).zfill(10)
-        url = f"https://data.sec.gov/submissions/CIK{cik_formatted}.json"
         
-        submissions_data = self._make_request(url)
+        submissions_data = await self._get_submissions(cik_formatted)
         if not submissions_data:
             return None
         
         # Check if this is a private company with Form D filings
-        if 'filings' in submissions_data and 'recent' in submissions_data['filings']:
-            recent_filings = submissions_data['filings']['recent']
-            
-            # Look for Form D filings
-            for i, form_type in enumerate(recent_filings.get('form', [])):
-                if form_type == 'D':  # Form D filing
-                    accession_number = recent_filings.get('accessionNumber', [None])[i]
-                    if accession_number:
-                        # Parse the Form D for industry information
-                        form_d_info = self.parse_form_d_filing(cik, accession_number)
-                        submissions_data['form_d_info'] = form_d_info
-                        break
+        recent_summary = self._summarize_recent(submissions_data.get('filings', {}).get('recent', {}))
+        submissions_data['recent_summary'] = recent_summary
+        
+        if recent_summary['form_d_accession']:
+            # Parse the Form D for industry information
+            form_d_info = await self.parse_form_d_filing(cik, recent_summary['form_d_accession'])
+            submissions_data['form_d_info'] = form_d_info
         
         return submissions_data
 
-    def extract_comprehensive_industry_info(self, submissions_data: Dict, company_name: str) -> Dict:
+    def extract_comprehensive_industry_info(self, submissions_data: Dict, company_name: str) -> IndustryInfo:
         """Extract comprehensive industry information from submissions data."""
-        industry_info = {
-            'sic_code': None,
-            'sic_description': None,
-            'business_description': None,
-            'industry_category': None,
-            'company_type': None,
-            'form_d_info': None,
-            'source': 'submissions'
-        }
+        industry_info = IndustryInfo()
         
         try:
             # Determine company type
             if submissions_data.get('tickers'):
-                industry_info['company_type'] = 'public'
+                industry_info.company_type = 'public'
             else:
-                industry_info['company_type'] = 'private'
+                industry_info.company_type = 'private'
             
             # Extract SIC information
             if 'sic' in submissions_data and submissions_data['sic']:
-                industry_info['sic_code'] = submissions_data['sic']
-                industry_info['sic_description'] = self.sic_mapping.get(
-                    str(submissions_data['sic']), f"SIC {submissions_data['sic']}"
-                )
+                sic = submissions_data['sic']
+                industry_info.sic_code = sic
+                sic_description = self._sic_lookup.get(sic)
+                if sic_description is None:
+                    # Memoize unmapped codes too
+                    sic_description = self._sic_lookup[sic] = sys.intern(f"SIC {sic}")
+                industry_info.sic_description = sic_description
             
             # Extract business description
             if 'businessDescription' in submissions_data:
                 desc = submissions_data['businessDescription']
                 if len(desc) > 300:
                     desc = desc[:300] + "..."
-                industry_info['business_description'] = desc
+                industry_info.business_description = desc
             
             # Extract Form D information for private companies
             if 'form_d_info' in submissions_data:
-                industry_info['form_d_info'] = submissions_data['form_d_info']
+                industry_info.form_d_info = submissions_data['form_d_info']
                 if submissions_data['form_d_info'].get('industry_category'):
-                    industry_info['industry_category'] = submissions_data['form_d_info']['industry_category']
+                    industry_info.industry_category = submissions_data['form_d_info']['industry_category']
             
             # Fallback to name-based classification if no other industry info
-            if not any([industry_info['sic_code'], industry_info['industry_category'], industry_info['business_description']]):
+            if not any([industry_info.sic_code, industry_info.industry_category, industry_info.business_description]):
                 name_classification = self.classify_industry_from_name(company_name)
-                industry_info.update(name_classification)
-                industry_info['source'] = 'name_classification'
+                industry_info.industry_category = name_classification['industry_category']
+                industry_info.confidence = name_classification['confidence']
+                industry_info.source = 'name_classification'
                 
         except Exception as e:
-            print(f"Error extracting comprehensive industry info: {e}")
+            logger.warning("Error extracting comprehensive industry info: %s", e)
         
         return industry_info
 
+    def _best_industry_rank(self, name_lower: str) -> Optional[int]:
+        """Priority rank of the highest-priority industry keyword in the name, if any."""
+        best_rank = None
+        for match in self._industry_keyword_re.finditer(name_lower):
+            rank = self._keyword_rank[match.group(1)]
+            if best_rank is None or rank < best_rank:
+                best_rank = rank
+                if rank == 0:
+                    break
+        return best_rank
+
     def classify_industry_from_name(self, company_name: str) -> Dict:
         """Classify industry based on company name patterns."""
         name_lower = company_name.lower()
         
-        # Enhanced keyword matching
-        industry_keywords = {
-            'Technology': ['software', 'tech', 'systems', 'data', 'cloud', 'cyber', 'digital', 
-                          'computer', 'platform', 'analytics', 'ai', 'artificial intelligence',
-                          'app', 'mobile', 'web', 'internet', 'online'],
-            'Financial Services': ['bank', 'financial', 'capital', 'investment', 'fund', 'credit', 
-                                 'loan', 'mortgage', 'insurance', 'securities', 'finance'],
-            'Healthcare': ['pharma', 'medical', 'health', 'bio', 'therapeutic', 'clinical',
-                          'hospital', 'drug', 'medicine', 'healthcare'],
-            'Retail': ['retail', 'store', 'shop', 'market', 'grocery', 'consumer', 'commerce'],
-            'Energy': ['energy', 'oil', 'gas', 'petroleum', 'solar', 'wind', 'utility',
-                      'electric', 'power', 'renewable'],
-            'Manufacturing': ['manufacturing', 'industrial', 'auto', 'motor', 'machinery',
-                            'equipment', 'materials', 'production'],
-            'Food & Beverage': ['food', 'restaurant', 'coffee', 'beverage', 'dining', 'kitchen',
-                              'cafe', 'bar', 'brewery', 'wine'],
-            'Real Estate': ['real estate', 'property', 'construction', 'building', 'development'],
-            'Transportation': ['transport', 'logistics', 'shipping', 'delivery', 'freight'],
-            'Media': ['media', 'entertainment', 'publishing', 'content', 'broadcast', 'film']
-        }
-        
         industry_info = {
             'industry_category': 'Unknown',
             'confidence': 'low'
         }
         
-        for industry, keywords in industry_keywords.items():
-            if any(keyword in name_lower for keyword in keywords):
-                industry_info['industry_category'] = industry
-                industry_info['confidence'] = 'medium'
-                break
+        # Keep the highest-priority industry among all keyword hits
+        best_rank = self._best_industry_rank(name_lower)
+        if best_rank is not None:
+            industry_info['industry_category'] = self.industry_categories[best_rank + 1]
+            industry_info['confidence'] = 'medium'
         
         return industry_info
 
-    def comprehensive_company_search(self, company_name: str, include_cik: str = None) -> List[Dict]:
+    def classify_industry_bulk(self, names: Iterable[str]) -> array:
         """
-        Comprehensive search including both public and private companies.
+        Classify many names in one call. Returns a compact unsigned-byte array
+        of ids into self.industry_categories, one per name (0 is 'Unknown').
         """
-        all_results = []
+        best_industry_rank = self._best_industry_rank
+        ids = array('B')
+        for name in names:
+            rank = best_industry_rank(name.lower())
+            ids.append(0 if rank is None else rank + 1)
+        return ids
+
+    async def classify_industry_bulk_async(self, names: Iterable[str]) -> array:
+        """Run classify_industry_bulk on a worker thread so the event loop stays free."""
+        return await asyncio.to_thread(self.classify_industry_bulk, list(names))
+
+    async def _process_match(self, match: Dict, enhanced_data: Optional[Dict] = None) -> Optional[CompanyRecord]:
+        """
+        Build the result for one match, fetching its enhanced submissions data
+        unless it was already fetched.
+        """
+        logger.info("📊 Processing: %s (CIK: %s)...", match['name'], match['cik'])
+        
+        # Get enhanced submissions data
+        if enhanced_data is None:
+            enhanced_data = await self.get_enhanced_submissions_data(match['cik'])
+        if not enhanced_data:
+            return None
+        
+        # Extract comprehensive industry information
+        industry_info = self.extract_comprehensive_industry_info(enhanced_data, match['name'])
         
+        return CompanyRecord(
+            cik=match['cik'],
+            name=match['name'],
+            ticker=match.get('ticker', ''),
+            company_type=industry_info.company_type or match.get('company_type', 'unknown'),
+            sic_code=industry_info.sic_code,
+            sic_description=industry_info.sic_description,
+            business_description=industry_info.business_description,
+            industry_category=industry_info.industry_category,
+            form_d_info=industry_info.form_d_info,
+            data_source=industry_info.source,
+            filing_count=enhanced_data['recent_summary']['form_count']
+        )
+
+    async def comprehensive_company_search(self, company_name: str, include_cik: str = None) -> List[CompanyRecord]:
+        """
+        Comprehensive search including both public and private companies.
+        """
         # Method 1: Search public companies
-        print(f"🔍 Searching public companies for '{company_name}'...")
-        public_matches = self.search_public_companies(company_name)
+        logger.info("🔍 Searching public companies for '%s'...", company_name)
+        searches = [self.search_public_companies(company_name)]
         
-        # Method 2: If CIK provided, search directly
+        # Method 2: If CIK provided, search directly. The enhanced data is fetched
+        # right away and reused below, so the CIK is only looked up once.
         if include_cik:
-            print(f"🎯 Searching by CIK: {include_cik}")
-            cik_result = self.search_by_cik_direct(include_cik)
-            if cik_result:
-                public_matches.append(cik_result)
-        
-        # Method 3: Enhanced processing for all found companies
-        for match in public_matches[:5]:  # Limit to avoid rate limiting
-            print(f"📊 Processing: {match['name']} (CIK: {match['cik']})...")
-            
-            # Get enhanced submissions data
-            enhanced_data = self.get_enhanced_submissions_data(match['cik'])
-            if enhanced_data:
-                # Extract comprehensive industry information
-                industry_info = self.extract_comprehensive_industry_info(enhanced_data, match['name'])
-                
-                result = {
-                    'cik': match['cik'],
-                    'name': match['name'],
-                    'ticker': match.get('ticker', ''),
-                    'company_type': industry_info.get('company_type', match.get('company_type', 'unknown')),
-                    'sic_code': industry_info.get('sic_code'),
-                    'sic_description': industry_info.get('sic_description'),
-                    'business_description': industry_info.get('business_description'),
-                    'industry_category': industry_info.get('industry_category'),
-                    'form_d_info': industry_info.get('form_d_info'),
-                    'data_source': industry_info.get('source'),
-                    'filing_count': len(enhanced_data.get('filings', {}).get('recent', {}).get('form', []))
-                }
-                
-                all_results.append(result)
+            logger.info("🎯 Searching by CIK: %s", include_cik)
+            searches.append(self.get_enhanced_submissions_data(include_cik))
         
-        return all_results
+        public_matches, *cik_data = await asyncio.gather(*searches)
+        prefetched = {}
+        if cik_data and cik_data[0]:
+            cik_match = self._match_from_submissions(str(include_cik).zfill(10), cik_data[0])
+            prefetched[cik_match['cik']] = cik_data[0]
+            public_matches.append(cik_match)
+        
+        # Method 3: Enhanced processing for all found companies, fetched concurrently
+        results = await asyncio.gather(
+            *(self._process_match(match, prefetched.get(match['cik']))
+              for match in public_matches[:5])  # Limit to avoid rate limiting
+        )
+        
+        return [result for result in results if result]
 
 
-def main():
+async def run_searches(refresh: bool = False, bulk: bool = False) -> None:
     # Initialize the comprehensive search
-    searcher = CompleteSECCompanySearch("MyCompany support@mycompany.com")
-    
-    # Test cases including both public and private companies
-    test_cases = [
-        {"name": "Tesla", "cik": None}, 
-        {"name": "Hexify", "cik": "1518449"},  # Private company from your example
-    ]
-    
-    for test_case in test_cases:
-        print(f"\n{'='*80}")
-        print(f"🚀 SEARCHING: {test_case['name']}")
-        if test_case['cik']:
-            print(f"📋 Including CIK: {test_case['cik']}")
-        print('='*80)
-        
-        results = searcher.comprehensive_company_search(
-            test_case['name'], 
-            test_case['cik']
-        )
+    async with CompleteSECCompanySearch("MyCompany support@mycompany.com", refresh=refresh) as searcher:
+        if bulk:
+            await searcher.load_bulk_submissions()
         
-        if results:
-            for company in results:
-                print(f"\n📈 Company: {company['name']}")
-                print(f"🎯 CIK: {company['cik']}")
-                print(f"🏢 Type: {company['company_type'].upper()}")
-                print(f"📊 Ticker: {company['ticker'] or 'N/A'}")
-                print(f"🏷️  SIC Code: {company['sic_code'] or 'N/A'}")
-                print(f"🏭 SIC Description: {company['sic_description'] or 'N/A'}")
-                print(f"🎨 Industry Category: {company['industry_category'] or 'N/A'}")
-                print(f"📝 Business Description: {company['business_description'] or 'N/A'}")
-                print(f"📋 Filing Count: {company['filing_count']}")
-                print(f"📡 Data Source: {company['data_source']}")
+        # Test cases including both public and private companies
+        test_cases = [
+            {"name": "Tesla", "cik": None}, 
+            {"name": "Hexify", "cik": "1518449"},  # Private company from your example
+        ]
+        
+        for test_case in test_cases:
+            print(f"\n{'='*80}")
+            print(f"🚀 SEARCHING: {test_case['name']}")
+            if test_case['cik']:
+                print(f"📋 Including CIK: {test_case['cik']}")
+            print('='*80)
+        
+            results = await searcher.comprehensive_company_search(
+                test_case['name'], 
+                test_case['cik']
+            )
+        
+            if results:
+                for company in results:
+                    print(f"\n📈 Company: {company.name}")
+                    print(f"🎯 CIK: {company.cik}")
+                    print(f"🏢 Type: {company.company_type.upper()}")
+                    print(f"📊 Ticker: {company.ticker or 'N/A'}")
+                    print(f"🏷️  SIC Code: {company.sic_code or 'N/A'}")
+                    print(f"🏭 SIC Description: {company.sic_description or 'N/A'}")
+                    print(f"🎨 Industry Category: {company.industry_category or 'N/A'}")
+                    print(f"📝 Business Description: {company.business_description or 'N/A'}")
+                    print(f"📋 Filing Count: {company.filing_count}")
+                    print(f"📡 Data Source: {company.data_source}")
                 
-                if company['form_d_info']:
-                    print(f"💼 Form D Info: {company['form_d_info']}")
+                    if company.form_d_info:
+                        print(f"💼 Form D Info: {company.form_d_info}")
                     
-                print("-" * 60)
-        else:
-            print("❌ No results found")
+                    print("-" * 60)
+            else:
+                print("❌ No results found")
+
+
+def configure_logging(level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """
+    Route log records through a queue so the actual writes happen on a
+    background thread instead of blocking the event loop.
+    """
+    log_queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    root_logger = logging.getLogger()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(level)
+    logging.getLogger('httpx').setLevel(logging.WARNING)  # httpx logs every request at INFO
+    
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search SEC EDGAR for public and private companies.")
+    parser.add_argument('--refresh', action='store_true',
+                        help="ignore cached submissions data and fetch it again")
+    parser.add_argument('--bulk', action='store_true',
+                        help="preload the submissions cache from SEC's bulk submissions.zip")
+    args = parser.parse_args()
+    
+    listener = configure_logging()
+    try:
+        asyncio.run(run_searches(refresh=args.refresh, bulk=args.bulk))
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":